@@ -1,22 +1,42 @@
 import ast
+import asyncio
 import datetime
+import functools
+import hashlib
 import json
+import logging
 import os
 import re
+import threading
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Annotated, Any, Dict, Optional
 
+import anyio
+import anyio.to_thread
+import cachetools
 import ee
-import gradio as gr
+import google.oauth2.credentials
+import msgspec
+import orjson
+import requests
+import requests.adapters
 from fastapi import FastAPI, HTTPException, Request
 from pydantic import BaseModel
-from geemap.ee_tile_layers import _get_tile_url_format, _validate_palette
 from starlette.middleware.cors import CORSMiddleware
 from starlette.middleware.trustedhost import TrustedHostMiddleware
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 
 MAX_REQUEST_BYTES = int(os.environ.get("MAX_REQUEST_BYTES", "1048576"))
+TILE_CACHE_SIZE = int(os.environ.get("TILE_CACHE_SIZE", "4096"))
+TILE_CACHE_TTL_SECONDS = int(os.environ.get("TILE_CACHE_TTL_SECONDS", "3600"))
+EE_API_URL = os.environ.get(
+    "EE_API_URL", "https://earthengine-highvolume.googleapis.com"
+)
+EE_MAX_CONCURRENCY = int(os.environ.get("EE_MAX_CONCURRENCY", "200"))
+THREADPOOL_SIZE = int(os.environ.get("THREADPOOL_SIZE", "256"))
+ENABLE_GRADIO = os.environ.get("ENABLE_GRADIO", "1") == "1"
 MAX_ASSET_ID_LENGTH = 256
 MAX_VIS_PARAMS_BYTES = 4096
 MIN_SCALE_METERS = 1
@@ -24,17 +44,41 @@ MAX_SCALE_METERS = 10000
 MIN_DENOMINATOR = 1
 MAX_DENOMINATOR = 1e12
 MAX_BBOX_AREA_DEGREES = 2500
+EE_EXPRESSION_CACHE_SIZE = 1024
+ASSET_TYPE_CACHE_SIZE = 8192
+PALETTE_CACHE_SIZE = 256
+VIS_PARAMS_CACHE_SIZE = 1024
+MAX_TILE_BATCH_SIZE = 100
 ASSET_ID_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_./:-]{0,255}$")
 SAFE_EE_CONSTRUCTORS = {
     "FeatureCollection": ee.FeatureCollection,
     "Image": ee.Image,
     "ImageCollection": ee.ImageCollection,
 }
+ASSET_TYPE_KINDS = {
+    "IMAGE": "Image",
+    "IMAGE_COLLECTION": "ImageCollection",
+    "TABLE": "FeatureCollection",
+    "TABLE_COLLECTION": "FeatureCollection",
+}
 DEFAULT_ALLOWED_ORIGINS = (
     "https://ee.opengeos.org,http://localhost:7865,http://127.0.0.1:7865"
 )
 DEFAULT_ALLOWED_HOSTS = "ee.opengeos.org,localhost,127.0.0.1,0.0.0.0"
 
+logger = logging.getLogger(__name__)
+
+_tile_cache: cachetools.TTLCache = cachetools.TTLCache(
+    maxsize=TILE_CACHE_SIZE, ttl=TILE_CACHE_TTL_SECONDS
+)
+_tile_cache_lock = threading.Lock()
+# Dedicated limiter so blocking Earth Engine calls don't compete with
+# Starlette's default threadpool that serves sync endpoints. Created in
+# lifespan() because older anyio releases need a running event loop.
+_ee_limiter: Optional[anyio.CapacityLimiter] = None
+_ee_init_lock = threading.Lock()
+_ee_initialized = False
+
 # # Earth Engine auth
 # if "EARTHENGINE_TOKEN" not in os.environ:
 #     raise RuntimeError("EARTHENGINE_TOKEN environment variable not found")
@@ -62,6 +106,21 @@ def get_env_var(key: str) -> Optional[str]:
     return os.environ.get(key)
 
 
+def build_ee_session() -> requests.Session:
+    """Builds the HTTP session shared by all Earth Engine API calls.
+
+    The connection pool is sized to EE_MAX_CONCURRENCY so every concurrent
+    tile request can reuse a kept-alive TLS connection.
+
+    Returns:
+        requests.Session: Session with a pooled HTTPS adapter.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=EE_MAX_CONCURRENCY)
+    session.mount("https://", adapter)
+    return session
+
+
 def ee_initialize(
     token_name: str = "EARTHENGINE_TOKEN",
     auth_mode: Optional[str] = None,
@@ -89,8 +148,35 @@ def ee_initialize(
             For example, opt_url='https://earthengine-highvolume.googleapis.com'
             to use the Earth Engine High-Volume platform. Defaults to {}.
     """
-    import google.oauth2.credentials
+    global _ee_initialized
+
+    with _ee_init_lock:
+        if _ee_initialized:
+            return
+        # pylint: disable-next=protected-access
+        state = ee.data._get_state()
+        if state.requests_session is None:
+            state.requests_session = build_ee_session()
+        _ee_initialize(token_name, auth_mode, auth_args, project, **kwargs)
+        _ee_initialized = True
+
+
+def _ee_initialize(
+    token_name: str,
+    auth_mode: Optional[str],
+    auth_args: Optional[Dict[str, Any]],
+    project: Optional[str],
+    **kwargs: Any,
+) -> None:
+    """Runs the Earth Engine authentication flow for ee_initialize().
 
+    Args:
+        token_name (str): The name of the Earth Engine token.
+        auth_mode (str, optional): The authentication mode.
+        auth_args (dict, optional): Additional parameters for ee.Authenticate().
+        project (str, optional): The Google cloud project ID for Earth Engine.
+        kwargs (dict, optional): Additional parameters for ee.Initialize().
+    """
     # pylint: disable-next=protected-access
     if ee.data._get_state().credentials is not None:
         return
@@ -106,7 +192,7 @@ def ee_initialize(
         except KeyError:
             raise ValueError("key_data JSON does not contain 'client_email'")
         credentials = ee.ServiceAccountCredentials(email=email, key_data=key_data)
-        ee.Initialize(credentials)
+        ee.Initialize(credentials, **kwargs)
         return
 
     ee_token = get_env_var(token_name)
@@ -143,6 +229,13 @@ def ee_initialize(
 
 
 # ---- Shared Tile Logic ----
+class TileError(HTTPException):
+    """Raised when a tile request cannot be fulfilled; maps to HTTP 400."""
+
+    def __init__(self, detail: str) -> None:
+        super().__init__(status_code=400, detail=detail)
+
+
 def parse_allowed_origins() -> list[str]:
     """Parses CORS origins from the ALLOWED_ORIGINS environment variable.
 
@@ -264,14 +357,15 @@ def validate_asset_id(asset_id: str) -> str:
     return asset_id
 
 
-def parse_safe_ee_expression(expression: str) -> ee.ComputedObject:
-    """Parses a supported Earth Engine constructor expression.
+@functools.lru_cache(maxsize=EE_EXPRESSION_CACHE_SIZE)
+def _parse_ee_expression(expression: str) -> tuple[str, str]:
+    """Parses a supported Earth Engine constructor expression once.
 
     Args:
         expression: Earth Engine expression such as ee.Image("USGS/SRTMGL1_003").
 
     Returns:
-        ee.ComputedObject: Constructed Earth Engine object.
+        tuple[str, str]: Constructor name and validated asset ID.
 
     Raises:
         ValueError: If the expression uses unsupported or unsafe syntax.
@@ -299,71 +393,185 @@ def parse_safe_ee_expression(expression: str) -> ee.ComputedObject:
     if not isinstance(arg, ast.Constant) or not isinstance(arg.value, str):
         raise ValueError("ee expressions must use a literal asset ID string")
 
-    asset_id = validate_asset_id(arg.value)
-    return SAFE_EE_CONSTRUCTORS[call.func.attr](asset_id)
+    return call.func.attr, validate_asset_id(arg.value)
+
+
+@functools.lru_cache(maxsize=ASSET_TYPE_CACHE_SIZE)
+def get_asset_type(asset_id: str) -> str:
+    """Gets the Earth Engine data type of a validated asset ID.
 
+    Asset types never change for a given ID, so lookups are cached to avoid a
+    getAsset round-trip on every request.
 
-def get_ee_object(asset_id: str) -> ee.ComputedObject:
+    Args:
+        asset_id: Validated Earth Engine asset ID.
+
+    Returns:
+        str: Earth Engine data type such as IMAGE or IMAGE_COLLECTION.
+    """
+    return ee.data.getAsset(asset_id)["type"]
+
+
+def get_ee_object(asset_id: str) -> tuple[ee.ComputedObject, str]:
     """Gets an Earth Engine object from a literal asset ID or safe expression.
 
     Args:
         asset_id: Literal asset ID or supported ee constructor expression.
 
     Returns:
-        ee.ComputedObject: Earth Engine object for the request.
+        tuple[ee.ComputedObject, str]: Earth Engine object for the request and
+            its kind, one of the SAFE_EE_CONSTRUCTORS keys.
 
     Raises:
         ValueError: If the asset ID or expression is unsupported.
     """
     asset_id = asset_id.strip()
     if asset_id.startswith("ee."):
-        return parse_safe_ee_expression(asset_id)
+        kind, asset_id = _parse_ee_expression(asset_id)
+        return SAFE_EE_CONSTRUCTORS[kind](asset_id), kind
 
     asset_id = validate_asset_id(asset_id)
-    data_dict = ee.data.getAsset(asset_id)
-    data_type = data_dict["type"]
-    if data_type == "IMAGE":
-        return ee.Image(asset_id)
-    if data_type == "IMAGE_COLLECTION":
-        return ee.ImageCollection(asset_id)
-    if data_type in ["TABLE", "TABLE_COLLECTION"]:
-        return ee.FeatureCollection(asset_id)
+    data_type = get_asset_type(asset_id)
+    kind = ASSET_TYPE_KINDS.get(data_type)
+    if kind is None:
+        raise ValueError(f"Unsupported data type: {data_type}")
 
-    raise ValueError(f"Unsupported data type: {data_type}")
+    return SAFE_EE_CONSTRUCTORS[kind](asset_id), kind
 
 
-def validate_vis_params(vis_params: Any) -> dict[str, Any]:
-    """Normalizes and validates visualization parameters.
+@functools.lru_cache(maxsize=PALETTE_CACHE_SIZE)
+def _get_named_palette(name: str) -> str | tuple[str, ...]:
+    """Resolves a named colormap such as "terrain" to its list of colors.
 
     Args:
-        vis_params: Visualization parameters as a dict or JSON object string.
+        name: Colormap name or single color such as "red".
 
     Returns:
-        dict[str, Any]: Validated visualization parameters.
+        str | tuple[str, ...]: Palette colors, or the normalized color string
+            geemap returns for a single color.
 
     Raises:
-        ValueError: If the parameters are malformed or too large.
+        ValueError: If the colormap name is unknown.
+    """
+    # geemap pulls in matplotlib and ipyleaflet, so only load it when a named
+    # colormap actually needs resolving.
+    from geemap.ee_tile_layers import _validate_palette
+
+    palette = _validate_palette(name)
+    if isinstance(palette, str):
+        return palette
+    return tuple(palette)
+
+
+def validate_palette(palette: Any) -> list[str] | str:
+    """Validates a palette, reusing resolved named colormaps.
+
+    Args:
+        palette: Colormap name or sequence of colors.
+
+    Returns:
+        list[str] | str: Palette colors, or a single color string.
+
+    Raises:
+        ValueError: If the palette is invalid.
+    """
+    if isinstance(palette, str):
+        named_palette = _get_named_palette(palette)
+        if isinstance(named_palette, str):
+            return named_palette
+        return list(named_palette)
+    if isinstance(palette, (list, tuple)):
+        return list(palette)
+    raise ValueError("The palette must be a list of colors or a colormap name.")
+
+
+@functools.lru_cache(maxsize=VIS_PARAMS_CACHE_SIZE)
+def _parse_vis_params(vis_params: str) -> MappingProxyType:
+    """Parses a JSON visualization parameter string once per distinct value.
+
+    Args:
+        vis_params: Visualization parameters as a JSON object string.
+
+    Returns:
+        MappingProxyType: Deep-frozen parsed parameters with a resolved palette,
+            with list values stored as tuples.
+
+    Raises:
+        ValueError: If the string is not a valid JSON object or palette.
+    """
+    try:
+        parsed = msgspec.to_builtins(VIS_PARAMS_DECODER.decode(vis_params))
+    except msgspec.ValidationError as exc:
+        raise ValueError(f"Invalid vis_params: {exc}") from exc
+    except msgspec.DecodeError as exc:
+        raise ValueError("vis_params must be valid JSON") from exc
+
+    if "palette" in parsed:
+        parsed["palette"] = validate_palette(parsed["palette"])
+
+    # VisParams values are scalars or flat lists, so tuples fully freeze them.
+    return MappingProxyType(
+        {
+            key: tuple(value) if isinstance(value, list) else value
+            for key, value in parsed.items()
+        }
+    )
+
+
+def _coerce_vis_params(vis_params: Any) -> dict[str, Any]:
+    """Converts visualization parameters to a dict.
+
+    Args:
+        vis_params: Visualization parameters as a VisParams struct, dict, JSON
+            object string, or None.
+
+    Returns:
+        dict[str, Any]: Visualization parameters as a dict.
+
+    Raises:
+        ValueError: If the parameters are not a JSON object.
     """
+    if isinstance(vis_params, VisParams):
+        return msgspec.to_builtins(vis_params)
+    if isinstance(vis_params, dict):
+        return vis_params
     if vis_params is None:
         return {}
+    if not isinstance(vis_params, str):
+        raise ValueError("vis_params must be a JSON object")
 
-    if isinstance(vis_params, str):
-        if len(vis_params.encode("utf-8")) > MAX_VIS_PARAMS_BYTES:
-            raise ValueError("vis_params is too large")
-        vis_params = vis_params.strip() or "{}"
-        try:
-            vis_params = json.loads(vis_params)
-        except json.JSONDecodeError as exc:
-            raise ValueError("vis_params must be valid JSON") from exc
+    if len(vis_params.encode("utf-8")) > MAX_VIS_PARAMS_BYTES:
+        raise ValueError("vis_params is too large")
+    if not vis_params or vis_params.isspace():
+        return {}
+
+    return {
+        key: list(value) if isinstance(value, tuple) else value
+        for key, value in _parse_vis_params(vis_params).items()
+    }
 
-    if not isinstance(vis_params, dict):
-        raise ValueError("vis_params must be a JSON object")
 
-    if len(json.dumps(vis_params).encode("utf-8")) > MAX_VIS_PARAMS_BYTES:
+def validate_vis_params(vis_params: dict[str, Any]) -> dict[str, Any]:
+    """Validates visualization parameters.
+
+    Args:
+        vis_params: Visualization parameters as a dict.
+
+    Returns:
+        dict[str, Any]: Validated visualization parameters.
+
+    Raises:
+        ValueError: If the parameters are malformed or too large.
+    """
+    try:
+        vis_params_bytes = len(orjson.dumps(vis_params))
+    except orjson.JSONEncodeError as exc:
+        raise ValueError("vis_params must be JSON serializable") from exc
+    if vis_params_bytes > MAX_VIS_PARAMS_BYTES:
         raise ValueError("vis_params is too large")
 
     if "palette" in vis_params:
-        vis_params["palette"] = _validate_palette(vis_params["palette"])
+        vis_params["palette"] = validate_palette(vis_params["palette"])
 
     return vis_params
 
@@ -404,6 +612,133 @@ def validate_jrc_request(req: "JRCWaterStatsRequest") -> tuple[list[float], str]
     return bbox, end_date
 
 
+def _apply_filters(
+    ee_object: ee.ComputedObject,
+    kind: str,
+    start_date: Optional[str],
+    end_date: Optional[str],
+    bbox: Optional[list[float]],
+) -> ee.ComputedObject:
+    """Applies optional date and bounding box filters to an Earth Engine object.
+
+    Args:
+        ee_object: Earth Engine object to filter.
+        kind: Object kind returned by get_ee_object().
+        start_date: Optional validated start date.
+        end_date: Optional validated end date.
+        bbox: Optional validated [west, south, east, north] bounding box.
+
+    Returns:
+        ee.ComputedObject: Filtered Earth Engine object.
+
+    Raises:
+        ValueError: If date filtering is requested for a non-ImageCollection.
+    """
+    # Apply date range filtering for ImageCollections
+    if start_date or end_date:
+        if kind != "ImageCollection":
+            raise ValueError("Date filtering is only supported for ImageCollections")
+        ee_object = ee_object.filterDate(
+            start_date or "1970-01-01", end_date or "2100-01-01"
+        )
+
+    # Apply bounding box filtering
+    if bbox:
+        geometry = ee.Geometry.BBox(*bbox)
+        if kind == "Image":
+            ee_object = ee_object.clip(geometry)
+        else:
+            ee_object = ee_object.filterBounds(geometry)
+
+    return ee_object
+
+
+def get_tile_url_format(
+    ee_object: ee.ComputedObject, kind: str, vis_params: dict[str, Any]
+) -> str:
+    """Renders an Earth Engine object and returns its tile URL format.
+
+    Mirrors geemap.ee_tile_layers._get_tile_url_format without importing geemap.
+
+    Args:
+        ee_object: Earth Engine object to render.
+        kind: Object kind returned by get_ee_object().
+        vis_params: Validated visualization parameters.
+
+    Returns:
+        str: Tile URL format with {z}/{x}/{y} placeholders.
+    """
+    if kind == "FeatureCollection":
+        color = vis_params.get("color", "000000")
+        outline = ee_object.style(
+            color=color, fillColor="00000000", width=vis_params.get("width", 2)
+        )
+        image = (
+            ee_object.style(fillColor=color)
+            .updateMask(ee.Image.constant(0.5))
+            .blend(outline)
+        )
+    elif kind == "ImageCollection":
+        image = ee_object.mosaic()
+    else:
+        image = ee_object
+
+    map_id_dict = ee.Image(image).getMapId(vis_params)
+    return map_id_dict["tile_fetcher"].url_format
+
+
+def _get_tile_from_dict(
+    asset_id: str,
+    vis_params: dict[str, Any],
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    bbox: Optional[list[float]] = None,
+) -> str:
+    """Gets an Earth Engine tile URL for dict visualization parameters.
+
+    Successful tile URLs are cached for TILE_CACHE_TTL_SECONDS, keyed on the
+    validated inputs, so repeated requests skip the Earth Engine round-trips.
+
+    Args:
+        asset_id: Earth Engine asset ID.
+        vis_params: Visualization parameters as a dict.
+        start_date: Optional start date for ImageCollection filtering.
+        end_date: Optional end date for ImageCollection filtering.
+        bbox: Optional [west, south, east, north] bounding box.
+
+    Returns:
+        str: Tile URL.
+
+    Raises:
+        TileError: If a request parameter is invalid or Earth Engine rejects it.
+    """
+    try:
+        start_date, end_date = validate_date_range(start_date, end_date)
+        bbox = validate_bbox(bbox)
+        vis_params = validate_vis_params(vis_params)
+        cache_key = (
+            asset_id.strip(),
+            orjson.dumps(vis_params, option=orjson.OPT_SORT_KEYS),
+            start_date,
+            end_date,
+            tuple(bbox) if bbox else None,
+        )
+        with _tile_cache_lock:
+            url = _tile_cache.get(cache_key)
+        if url is not None:
+            return url
+
+        ee_object, kind = get_ee_object(asset_id)
+        ee_object = _apply_filters(ee_object, kind, start_date, end_date, bbox)
+        url = get_tile_url_format(ee_object, kind, vis_params)
+    except (ValueError, ee.EEException) as e:
+        raise TileError(str(e)) from e
+
+    with _tile_cache_lock:
+        _tile_cache[cache_key] = url
+    return url
+
+
 def get_tile(
     asset_id: str,
     vis_params: Any = None,
@@ -415,7 +750,7 @@ def get_tile(
 
     Args:
         asset_id: Earth Engine asset ID.
-        vis_params: Visualization parameters.
+        vis_params: Visualization parameters as a dict or JSON object string.
         start_date: Optional start date for ImageCollection filtering.
         end_date: Optional end date for ImageCollection filtering.
         bbox: Optional [west, south, east, north] bounding box.
@@ -424,48 +759,17 @@ def get_tile(
         str: Tile URL or an Error-prefixed message for UI callers.
     """
     try:
-        start_date, end_date = validate_date_range(start_date, end_date)
-        bbox = validate_bbox(bbox)
-        vis_params = validate_vis_params(vis_params)
-        ee_object = get_ee_object(asset_id)
-
-        # Apply date range filtering for ImageCollections
-        if start_date or end_date:
-            if isinstance(ee_object, ee.ImageCollection):
-                if start_date and end_date:
-                    ee_object = ee_object.filterDate(start_date, end_date)
-                elif start_date:
-                    ee_object = ee_object.filterDate(start_date, "2100-01-01")
-                elif end_date:
-                    ee_object = ee_object.filterDate("1970-01-01", end_date)
-            else:
-                raise ValueError(
-                    "Date filtering is only supported for ImageCollections"
-                )
-
-        # Apply bounding box filtering
-        if bbox:
-            geometry = ee.Geometry.BBox(*bbox)
-            if isinstance(ee_object, ee.ImageCollection):
-                ee_object = ee_object.filterBounds(geometry)
-            elif isinstance(ee_object, ee.FeatureCollection):
-                ee_object = ee_object.filterBounds(geometry)
-            elif isinstance(ee_object, ee.Image):
-                ee_object = ee_object.clip(geometry)
-            else:
-                raise ValueError(
-                    f"Bounding box filtering not supported for {type(ee_object)}"
-                )
-
-        url = _get_tile_url_format(ee_object, vis_params)
-        return url
-    except Exception as e:
+        vis_params = _coerce_vis_params(vis_params)
+        return _get_tile_from_dict(asset_id, vis_params, start_date, end_date, bbox)
+    except ValueError as e:
         return f"Error: {str(e)}"
+    except TileError as e:
+        return f"Error: {e.detail}"
 
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
-    """Initializes Earth Engine during the API server lifespan.
+    """Initializes Earth Engine and the threadpool during the API server lifespan.
 
     Args:
         _app: FastAPI application instance.
@@ -473,7 +777,11 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
     Yields:
         None: Control to the running ASGI application.
     """
-    ee_initialize()
+    global _ee_limiter
+
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    _ee_limiter = anyio.CapacityLimiter(EE_MAX_CONCURRENCY)
+    ee_initialize(opt_url=EE_API_URL)
     yield
 
 
@@ -514,16 +822,91 @@ app.add_middleware(
 app.add_middleware(TrustedHostMiddleware, allowed_hosts=parse_allowed_hosts())
 
 
-class TileRequest(BaseModel):
+class VisParams(msgspec.Struct, omit_defaults=True, forbid_unknown_fields=True):
+    """Visualization parameters accepted by the tile endpoints.
+
+    Image fields follow ee.Image.getMapId(); color and width style
+    FeatureCollections.
+    """
+
+    bands: str | list[str] | None = None
+    min: float | list[float] | str | None = None
+    max: float | list[float] | str | None = None
+    gain: float | list[float] | str | None = None
+    bias: float | list[float] | str | None = None
+    gamma: float | list[float] | str | None = None
+    palette: str | list[str] | None = None
+    opacity: float | None = None
+    force_rgb_output: bool | None = msgspec.field(default=None, name="forceRgbOutput")
+    format: str | None = None  # "png" or "jpg"
+    color: str | None = None
+    width: float | None = None
+
+
+class TileRequest(msgspec.Struct):
     """Request model for the tile endpoint."""
 
     asset_id: str
-    vis_params: dict | str | None = None
+    vis_params: VisParams | str | None = None
     start_date: str | None = None
     end_date: str | None = None
     bbox: list[float] | None = None  # [west, south, east, north]
 
 
+class TileBatchRequest(msgspec.Struct):
+    """Request model for the batch tile endpoint."""
+
+    items: Annotated[list[TileRequest], msgspec.Meta(max_length=MAX_TILE_BATCH_SIZE)]
+
+
+VIS_PARAMS_DECODER = msgspec.json.Decoder(VisParams)
+TILE_REQUEST_DECODER = msgspec.json.Decoder(TileRequest)
+TILE_BATCH_REQUEST_DECODER = msgspec.json.Decoder(TileBatchRequest)
+
+
+def _inline_schema_refs(node: Any, components: dict[str, Any]) -> Any:
+    """Replaces JSON schema $ref entries with their component definitions.
+
+    Args:
+        node: JSON schema node to resolve.
+        components: Component schemas keyed by name, as referenced by $ref.
+
+    Returns:
+        Any: The schema node with all references inlined.
+    """
+    if isinstance(node, dict):
+        if "$ref" in node:
+            return _inline_schema_refs(components[node["$ref"]], components)
+        return {
+            key: _inline_schema_refs(value, components) for key, value in node.items()
+        }
+    if isinstance(node, list):
+        return [_inline_schema_refs(value, components) for value in node]
+    return node
+
+
+def openapi_request_body(model: type) -> dict[str, Any]:
+    """Builds an OpenAPI request body for a route that decodes with msgspec.
+
+    Args:
+        model: msgspec Struct type decoded from the request body.
+
+    Returns:
+        dict[str, Any]: openapi_extra value with an inlined JSON schema.
+    """
+    (schema,), components = msgspec.json.schema_components(
+        (model,), ref_template="{name}"
+    )
+    return {
+        "requestBody": {
+            "content": {
+                "application/json": {"schema": _inline_schema_refs(schema, components)}
+            },
+            "required": True,
+        }
+    }
+
+
 class JRCWaterStatsRequest(BaseModel):
     """Request model for JRC water statistics endpoint."""
 
@@ -547,22 +930,162 @@ def healthz() -> dict[str, str]:
     return {"status": "ok"}
 
 
-@app.post("/tile")
-def get_tile_api(req: TileRequest) -> dict[str, str]:
-    """Returns a tile URL for a supported Earth Engine asset.
+def decode_request(body: bytes, decoder: msgspec.json.Decoder) -> Any:
+    """Decodes and validates a JSON request body.
+
+    Args:
+        body: Raw JSON request body.
+        decoder: Decoder for the expected request struct.
+
+    Returns:
+        Any: Decoded request struct.
+
+    Raises:
+        HTTPException: If the body does not match the request struct.
+    """
+    try:
+        return decoder.decode(body)
+    except msgspec.DecodeError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+
+def _get_tile_from_request(req: TileRequest) -> str:
+    """Coerces visualization parameters and gets a tile URL for a request.
+
+    Runs on a worker thread, since parsing vis_params may import geemap to
+    resolve a named palette.
 
     Args:
-        req: Tile URL request.
+        req: Decoded tile request.
 
     Returns:
-        dict[str, str]: Tile URL response.
+        str: Tile URL.
+
+    Raises:
+        TileError: If the request is invalid or Earth Engine rejects it.
     """
-    result = get_tile(
-        req.asset_id, req.vis_params, req.start_date, req.end_date, req.bbox
+    try:
+        vis_params = _coerce_vis_params(req.vis_params)
+    except ValueError as e:
+        raise TileError(str(e)) from e
+
+    return _get_tile_from_dict(
+        req.asset_id, vis_params, req.start_date, req.end_date, req.bbox
     )
-    if isinstance(result, str) and result.startswith("Error"):
-        raise HTTPException(status_code=400, detail=result)
-    return {"tile_url": result}
+
+
+async def get_tile_async(req: TileRequest) -> str:
+    """Gets a tile URL on the Earth Engine thread limiter.
+
+    Args:
+        req: Decoded tile request.
+
+    Returns:
+        str: Tile URL.
+
+    Raises:
+        TileError: If the request is invalid or Earth Engine rejects it.
+    """
+    return await anyio.to_thread.run_sync(
+        _get_tile_from_request, req, limiter=_ee_limiter
+    )
+
+
+def tile_etag(tile_url: str) -> str:
+    """Builds a strong ETag for a tile URL response.
+
+    Args:
+        tile_url: Tile URL returned to the client.
+
+    Returns:
+        str: Quoted ETag value.
+    """
+    digest = hashlib.blake2b(tile_url.encode("utf-8"), digest_size=8).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Checks whether an If-None-Match header matches an ETag.
+
+    Args:
+        if_none_match: Raw If-None-Match header value, if any.
+        etag: Current quoted ETag value.
+
+    Returns:
+        bool: True if the client already holds the current representation.
+    """
+    if not if_none_match:
+        return False
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+@app.post("/tile", openapi_extra=openapi_request_body(TileRequest))
+async def get_tile_api(request: Request) -> Response:
+    """Returns a tile URL for a supported Earth Engine asset.
+
+    Responses carry Cache-Control and ETag headers, and a matching
+    If-None-Match header yields 304 Not Modified.
+
+    Args:
+        request: Tile URL request with a JSON TileRequest body.
+
+    Returns:
+        Response: Tile URL response or 304 Not Modified.
+    """
+    req = decode_request(await request.body(), TILE_REQUEST_DECODER)
+    result = await get_tile_async(req)
+    etag = tile_etag(result)
+    headers = {
+        "Cache-Control": f"public, max-age={TILE_CACHE_TTL_SECONDS}",
+        "ETag": etag,
+    }
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return JSONResponse({"tile_url": result}, headers=headers)
+
+
+async def _get_tile_result(req: TileRequest) -> dict[str, str]:
+    """Gets a tile URL or error message for one batch item.
+
+    Unexpected failures are logged and reported for the item alone, so one
+    bad item cannot fail the whole batch.
+
+    Args:
+        req: Decoded tile request.
+
+    Returns:
+        dict[str, str]: Either {"tile_url": ...} or {"error": ...}.
+    """
+    try:
+        return {"tile_url": await get_tile_async(req)}
+    except TileError as e:
+        return {"error": e.detail}
+    except Exception:
+        logger.exception("Unexpected error for batch item %r", req.asset_id)
+        return {"error": "Internal error while generating the tile URL"}
+
+
+@app.post("/tiles", openapi_extra=openapi_request_body(TileBatchRequest))
+async def get_tiles_api(request: Request) -> dict[str, list[dict[str, str]]]:
+    """Returns tile URLs for a batch of Earth Engine asset requests.
+
+    Items are resolved concurrently on the shared Earth Engine thread limiter,
+    and each result is reported independently.
+
+    Args:
+        request: Batch request with a JSON TileBatchRequest body.
+
+    Returns:
+        dict[str, list[dict[str, str]]]: Per-item tile URLs or errors, in order.
+    """
+    batch = decode_request(await request.body(), TILE_BATCH_REQUEST_DECODER)
+    results = await asyncio.gather(*(_get_tile_result(req) for req in batch.items))
+    return {"tiles": list(results)}
 
 
 @app.post("/jrc-water-stats")
@@ -706,42 +1229,50 @@ def get_tile_gradio(asset_id, vis_params, start_date, end_date, bbox_str):
 
     # Convert bbox string to list
     bbox = None
-    if bbox_str and bbox_str.strip():
+    if bbox_str and not bbox_str.isspace():
         try:
-            bbox = [float(x.strip()) for x in bbox_str.split(",")]
+            west, south, east, north = map(float, bbox_str.split(","))
         except ValueError:
-            return "Error: bbox must be comma-separated numbers (west,south,east,north)"
+            return (
+                "Error: bbox must be 4 comma-separated numbers (west,south,east,north)"
+            )
+        bbox = [west, south, east, north]
 
     return get_tile(asset_id, vis_params, start_date, end_date, bbox)
 
 
-gradio_ui = gr.Interface(
-    fn=get_tile_gradio,
-    inputs=[
-        gr.Textbox(label="Earth Engine Asset ID", placeholder="e.g., USGS/SRTMGL1_003"),
-        gr.Textbox(
-            label="Visualization Parameters (JSON)",
-            placeholder='{"min":0,"max":5000,"palette":"terrain"}',
-        ),
-        gr.Textbox(
-            label="Start Date (Optional)",
-            placeholder="e.g., 2023-01-01",
-            value="",
-        ),
-        gr.Textbox(
-            label="End Date (Optional)",
-            placeholder="e.g., 2023-12-31",
-            value="",
-        ),
-        gr.Textbox(
-            label="Bounding Box (Optional)",
-            placeholder="e.g., -122.5,37.5,-122.0,38.0 (west,south,east,north)",
-            value="",
-        ),
-    ],
-    outputs="text",
-    title="Earth Engine Tile URL Generator",
-    description="Supports ee.Image, ee.ImageCollection, ee.FeatureCollection with optional date range and bbox filtering. Tile URL is suitable for basemap usage.",
-)
+if ENABLE_GRADIO:
+    import gradio as gr
+
+    gradio_ui = gr.Interface(
+        fn=get_tile_gradio,
+        inputs=[
+            gr.Textbox(
+                label="Earth Engine Asset ID", placeholder="e.g., USGS/SRTMGL1_003"
+            ),
+            gr.Textbox(
+                label="Visualization Parameters (JSON)",
+                placeholder='{"min":0,"max":5000,"palette":"terrain"}',
+            ),
+            gr.Textbox(
+                label="Start Date (Optional)",
+                placeholder="e.g., 2023-01-01",
+                value="",
+            ),
+            gr.Textbox(
+                label="End Date (Optional)",
+                placeholder="e.g., 2023-12-31",
+                value="",
+            ),
+            gr.Textbox(
+                label="Bounding Box (Optional)",
+                placeholder="e.g., -122.5,37.5,-122.0,38.0 (west,south,east,north)",
+                value="",
+            ),
+        ],
+        outputs="text",
+        title="Earth Engine Tile URL Generator",
+        description="Supports ee.Image, ee.ImageCollection, ee.FeatureCollection with optional date range and bbox filtering. Tile URL is suitable for basemap usage.",
+    )
 
-app = gr.mount_gradio_app(app, gradio_ui, path="/")
+    app = gr.mount_gradio_app(app, gradio_ui, path="/")